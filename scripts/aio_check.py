@@ -0,0 +1,234 @@
+import gc
+import sys
+import random
+import asyncio
+import argparse
+import threading
+from typing import Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+import rasterization
+from rasterization import aio
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+
+    # Records the shapes of every batch handed to the executor, along with the most batches ever running at once
+    def __init__(self, max_workers: int):
+
+        super().__init__(max_workers=max_workers)
+        self._lock: threading.Lock = threading.Lock()
+        self._running: int = 0
+        self.max_running: int = 0
+        self.batches: list[np.ndarray] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+
+        def run() -> Any:
+
+            with self._lock:
+                self._running += 1
+                self.max_running = max(self.max_running, self._running)
+                self.batches.append(args[0])
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        return super().submit(run)
+
+
+def random_lines(rng: random.Random, count: int, max_length: int) -> np.ndarray:
+
+    return np.array([(x, y, x + rng.randint(-max_length, max_length), y + rng.randint(-max_length, max_length))
+                     for x, y in ((rng.randint(-1000, 1000), rng.randint(-1000, 1000)) for _ in range(count))],
+                    dtype=np.int64).reshape(-1, 4)
+
+
+def same_result(result: tuple[np.ndarray, np.ndarray], expected: tuple[np.ndarray, np.ndarray]) -> bool:
+
+    return np.array_equal(result[0], expected[0]) and np.array_equal(result[1], expected[1])
+
+
+async def check_coalescing(rng: random.Random, requests: int) -> list[str]:
+
+    executor: RecordingExecutor = RecordingExecutor(max_workers=4)
+    rasterizer: aio.Rasterizer = aio.Rasterizer(executor=executor)
+    endpoints: list[np.ndarray] = [random_lines(rng, rng.randint(1, 3), 50) for _ in range(requests)]
+
+    results: list[tuple[np.ndarray, np.ndarray]] = \
+        await asyncio.gather(*[rasterizer.lines(request_endpoints) for request_endpoints in endpoints])
+    executor.shutdown()
+
+    failures: list[str] = [f"lines request {n:d} differs from Lines"
+                           for n, (request_endpoints, result) in enumerate(zip(endpoints, results))
+                           if not same_result(result, rasterization.Lines(request_endpoints))]
+    if len(executor.batches) >= requests:
+        failures.append(f"{requests:d} requests of the same tick ran as {len(executor.batches):d} batches")
+
+    return failures
+
+
+async def check_pixel_budget(rng: random.Random, max_batch_pixels: int) -> list[str]:
+
+    executor: RecordingExecutor = RecordingExecutor(max_workers=4)
+    rasterizer: aio.Rasterizer = aio.Rasterizer(executor=executor, max_batch_pixels=max_batch_pixels)
+    long_line: np.ndarray = np.array([[0, 0, 50*max_batch_pixels, 1]], dtype=np.int64)
+    endpoints: list[np.ndarray] = [random_lines(rng, 1, 100) for _ in range(200)]
+
+    results: list[tuple[np.ndarray, np.ndarray]] = \
+        await asyncio.gather(*[rasterizer.lines(request_endpoints) for request_endpoints in [long_line] + endpoints])
+    executor.shutdown()
+
+    failures: list[str] = [f"lines request {n:d} differs from Lines"
+                           for n, (request_endpoints, result) in enumerate(zip([long_line] + endpoints, results))
+                           if not same_result(result, rasterization.Lines(request_endpoints))]
+
+    for batch in executor.batches:
+        if len(batch) > 1 and (np.any(np.all(batch == long_line, axis=1)) or
+                               aio._line_pixels(batch).sum() > max_batch_pixels):
+            failures.append(f"a micro-batch of {len(batch):d} lines exceeded the pixel budget")
+
+    return failures
+
+
+async def check_backpressure(rng: random.Random, max_pending_batches: int) -> list[str]:
+
+    executor: RecordingExecutor = RecordingExecutor(max_workers=8)
+    rasterizer: aio.Rasterizer = \
+        aio.Rasterizer(executor=executor, max_pending_batches=max_pending_batches, max_batch_shapes=2)
+    endpoints: list[np.ndarray] = [random_lines(rng, 2, 3000) for _ in range(64)]
+
+    await asyncio.gather(*[rasterizer.lines(request_endpoints) for request_endpoints in endpoints])
+    executor.shutdown()
+
+    if executor.max_running > max_pending_batches:
+        return [f"{executor.max_running:d} batches ran at once, over the limit of {max_pending_batches:d}"]
+
+    return []
+
+
+async def check_retry(rng: random.Random) -> list[str]:
+
+    rasterizer: aio.Rasterizer = aio.Rasterizer()
+    endpoints: list[np.ndarray] = [random_lines(rng, 2, 50) for _ in range(8)]
+    bad_endpoints: np.ndarray = np.array([[0, 0, 1 << 62, 0]], dtype=np.int64)
+
+    results: list[tuple[np.ndarray, np.ndarray] | BaseException] = \
+        await asyncio.gather(*[rasterizer.lines(request_endpoints) for request_endpoints in endpoints + [bad_endpoints]],  # noqa: E501
+                             return_exceptions=True)
+
+    failures: list[str] = [f"lines request {n:d} next to an invalid one differs from Lines"
+                           for n, (request_endpoints, result) in enumerate(zip(endpoints, results))
+                           if isinstance(result, BaseException) or not same_result(result, rasterization.Lines(request_endpoints))]  # noqa: E501
+    if not isinstance(results[-1], OverflowError):
+        failures.append(f"the invalid lines request returned {results[-1]!r} instead of raising OverflowError")
+
+    return failures
+
+
+async def check_streaming(rng: random.Random, chunk_shapes: int) -> list[str]:
+
+    endpoints: np.ndarray = random_lines(rng, 10*chunk_shapes + 3, 200)
+    points: np.ndarray
+    offsets: np.ndarray
+    points, offsets = rasterization.Lines(endpoints)
+
+    start: int = 0
+    end: int
+    failures: list[str] = []
+    async for chunk_points, chunk_offsets in aio.stream_lines(endpoints, chunk_shapes):
+        end = start + len(chunk_offsets) - 1
+        if not same_result((chunk_points, chunk_offsets),
+                           (points[offsets[start]:offsets[end]], offsets[start:end + 1] - offsets[start])):
+            failures.append(f"stream_lines chunk of lines {start:d}:{end:d} differs from Lines")
+        start = end
+
+    if start != len(endpoints):
+        failures.append(f"stream_lines yielded {start:d} of {len(endpoints):d} lines")
+
+    return failures
+
+
+async def check_limits() -> list[str]:
+
+    invalid_limits: list[dict[str, Any]] = \
+        [{"max_pending_batches": 0}, {"max_batch_shapes": 0}, {"max_batch_pixels": -1}]
+
+    failures: list[str] = []
+    for limits in invalid_limits:
+        try:
+            aio.Rasterizer(**limits)
+            failures.append(f"Rasterizer({limits}) did not raise ValueError")
+        except ValueError:
+            pass
+
+    try:
+        async for _ in aio.stream_lines(np.zeros((3, 4), dtype=np.int64), 0):
+            pass
+        failures.append("stream_lines with chunk_shapes=0 did not raise ValueError")
+    except ValueError:
+        pass
+
+    return failures
+
+
+def check_loop_release(runs: int) -> list[str]:
+
+    async def contended_lines() -> None:
+
+        await asyncio.gather(*[aio.lines(np.array([[0, 0, 100000, 1]], dtype=np.int64)) for _ in range(16)])
+
+    for _ in range(runs):
+        asyncio.run(contended_lines())
+    gc.collect()
+
+    # asyncio itself may keep the most recent loop alive until the next one starts
+    if len(aio._default_rasterizers) > 1:
+        return [f"{len(aio._default_rasterizers):d} default rasterizers outlived their {runs:d} closed loops"]
+
+    return []
+
+
+async def check(seed: int,
+                requests: int,
+                max_batch_pixels: int,
+                max_pending_batches: int,
+                chunk_shapes: int) -> list[str]:
+
+    rng: random.Random = random.Random(seed)
+
+    return await check_coalescing(rng, requests) + \
+        await check_pixel_budget(rng, max_batch_pixels) + \
+        await check_backpressure(rng, max_pending_batches) + \
+        await check_retry(rng) + \
+        await check_streaming(rng, chunk_shapes) + \
+        await check_limits()
+
+
+if (__name__ == "__main__"):
+
+    parser = \
+        argparse.ArgumentParser(prog="RasterizationAioCheck",
+                                description="Checks of the asyncio micro-batching layer against the batch Rasterization backends")  # noqa: E501
+
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--max-batch-pixels", type=int, default=1 << 12)
+    parser.add_argument("--max-pending-batches", type=int, default=2)
+    parser.add_argument("--chunk-shapes", type=int, default=64)
+    args: argparse.Namespace = parser.parse_args()
+
+    failures: list[str] = asyncio.run(check(args.seed,
+                                            args.requests,
+                                            args.max_batch_pixels,
+                                            args.max_pending_batches,
+                                            args.chunk_shapes)) + \
+        check_loop_release(5)
+
+    for failure in failures:
+        print(f"Failure: {failure:s}")
+    print(f"{len(failures):d} failures (seed {args.seed:d})")
+
+    sys.exit(1 if failures else 0)
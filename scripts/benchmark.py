@@ -0,0 +1,57 @@
+import timeit
+import argparse
+from typing import Callable
+import rasterization
+
+
+# Translating a shape by these offsets pushes it past the 32-bit limits and onto the 64-bit path
+LINE_OFFSET: int = 1 << 28
+CIRCLE_OFFSET: int = 1 << 40
+
+
+def octant_lines(length: int) -> list[tuple[int, int, int, int]]:
+
+    return [(0, 0, sgn_x*(length if non_steep else length//3), sgn_y*(length//3 if non_steep else length))
+            for non_steep in (False, True) for sgn_x in (1, -1) for sgn_y in (1, -1)]
+
+
+def benchmark_cases(length: int) -> dict[str, Callable[[], object]]:
+
+    lines: list[tuple[int, int, int, int]] = octant_lines(length)
+
+    return {"Line (8 octants)": lambda: [rasterization.Line(*line) for line in lines],
+            "Line (int32)": lambda: rasterization.Line(0, 0, length, length//3),
+            "Line (int64)": lambda: rasterization.Line(LINE_OFFSET, LINE_OFFSET, LINE_OFFSET + length, LINE_OFFSET + length//3),  # noqa: E501
+            "Circle (int32)": lambda: rasterization.Circle(length, 0, 0),
+            "Circle (int64)": lambda: rasterization.Circle(length, CIRCLE_OFFSET, CIRCLE_OFFSET),
+            "QuadBezier (int32)": lambda: rasterization.QuadBezier(0, 0, length//2, length, length, 0),
+            "CubicBezier (int32)": lambda: rasterization.CubicBezier(0, 0, 0, length, length, length, length, 0)}
+
+
+def run_benchmarks(length: int,
+                   number: int,
+                   repeat: int) -> None:
+
+    cases: dict[str, Callable[[], object]] = benchmark_cases(length)
+    max_name_length: int = max([len(name) for name in cases])
+
+    best_time: float
+    for name, case in cases.items():
+        best_time = min(timeit.repeat(case, number=number, repeat=repeat))/number
+        print(f"{name:>{max_name_length:d}s}: {1e6*best_time:10.2f} us/call")
+
+
+if (__name__ == "__main__"):
+
+    parser = \
+        argparse.ArgumentParser(prog="RasterizationBenchmark",
+                                description="Timing of the 32-bit and 64-bit Rasterization paths")
+
+    parser.add_argument("length", type=int)
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args: argparse.Namespace = parser.parse_args()
+
+    run_benchmarks(args.length,
+                   args.number,
+                   args.repeat)
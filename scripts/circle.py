@@ -5,118 +5,7 @@ import os
 import argparse
 from typing import Any
 import rasterization
-
-
-def py_impl_circle(radius: int,
-                   center: tuple[int, int]) -> np.ndarray[tuple[int, int], np.dtype[Any]]:
-
-    N: int = int(np.floor(radius/np.sqrt(2))) + 1
-    tau: int = 4*np.square(radius) - 5
-
-    first_octant_points: np.ndarray[tuple[int, int], np.dtype[Any]] = np.empty((N, 2), dtype=int)
-    first_octant_points[0] = (radius, 0)
-
-    decrement: bool
-
-    for n in range(0, N - 1):
-
-        decrement = 4*(np.square(first_octant_points[n][0]) - first_octant_points[n][0] + np.square(n) + 2*n) >= tau
-
-        first_octant_points[n + 1] = \
-            (first_octant_points[n][0] - (1 if decrement else 0),
-             first_octant_points[n][1] + 1)
-
-    overflow: int = 1 if first_octant_points[N - 1][0] == first_octant_points[N - 1][1] else 0
-    M: int = N - overflow
-    Q: int = 2*N - 1 - overflow
-
-    points: np.ndarray[tuple[int, int], np.dtype[Any]] = np.empty((4*Q, 2), dtype=int)
-
-    # Right-most point
-    points[0] = \
-        (first_octant_points[0][0] + center[0],
-         first_octant_points[0][1] + center[1])
-
-    # Upper-most point
-    points[Q] = \
-        (first_octant_points[0][1] + center[0],
-         first_octant_points[0][0] + center[1])
-
-    # Left-most point
-    points[2*Q] = \
-        (-first_octant_points[0][0] + center[0],
-          first_octant_points[0][1] + center[1])  # noqa: E127
-
-    # Bottom-most point
-    points[3*Q] = \
-        (-first_octant_points[0][1] + center[0],
-         -first_octant_points[0][0] + center[1])
-
-    if overflow == 1:
-
-        # Upper-left diagonal point
-        points[N - 1] = \
-            (first_octant_points[N - 1][0] + center[0],
-             first_octant_points[N - 1][1] + center[1])
-
-        # Upper-right diagonal point
-        points[2*Q - (N - 1)] = \
-            (-first_octant_points[N - 1][0] + center[0],
-              first_octant_points[N - 1][1] + center[1])  # noqa: E127
-
-        # Lower-right diagonal point
-        points[2*Q + (N - 1)] = \
-            (-first_octant_points[N - 1][0] + center[0],
-             -first_octant_points[N - 1][1] + center[1])
-
-        # Lower-left diagonal point
-        points[4*Q - (N - 1)] = \
-            ( first_octant_points[N - 1][0] + center[0],  # noqa: E201
-             -first_octant_points[N - 1][1] + center[1])  # noqa: E128
-
-    for m in range(1, M):
-
-        # First Octant
-        points[m] = \
-            (first_octant_points[m][0] + center[0],
-             first_octant_points[m][1] + center[1])
-
-        # Second Octant
-        points[Q - m] = \
-            (first_octant_points[m][1] + center[0],
-             first_octant_points[m][0] + center[1])
-
-        # Third Octant
-        points[Q + m] = \
-            (-first_octant_points[m][1] + center[0],
-              first_octant_points[m][0] + center[1])  # noqa: E127
-
-        # Fourth Octant
-        points[2*Q - m] = \
-            (-first_octant_points[m][0] + center[0],
-              first_octant_points[m][1] + center[1])  # noqa: E127
-
-        # Fifth Octant
-        points[2*Q + m] = \
-            (-first_octant_points[m][0] + center[0],
-             -first_octant_points[m][1] + center[1])
-
-        # Sixth Octant
-        points[3*Q - m] = \
-            (-first_octant_points[m][1] + center[0],
-             -first_octant_points[m][0] + center[1])
-
-        # Seventh Octant
-        points[3*Q + m] = \
-            ( first_octant_points[m][1] + center[0],  # noqa: E201
-             -first_octant_points[m][0] + center[1])  # noqa: E128
-
-        # Eighth Octant
-        points[4*Q - m] = \
-            ( first_octant_points[m][0] + center[0],  # noqa: E201
-             -first_octant_points[m][1] + center[1])  # noqa: E128
-
-    return points
+from reference import py_impl_circle  # noqa: F401
 
 
 def plot_circle_rasterization(radius: int,
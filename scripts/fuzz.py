@@ -0,0 +1,197 @@
+import sys
+import random
+import argparse
+from typing import Callable, Sequence
+import numpy as np
+import rasterization
+from reference import py_impl_line, py_impl_circle
+
+
+# Limits of the 32-bit and 64-bit paths, mirroring Rasterization::max_line_coordinate and max_circle_radius
+INT32_MAX_LINE_COORDINATE: int = 1 << 27
+INT64_MAX_LINE_COORDINATE: int = 1 << 59
+INT32_MAX_CIRCLE_RADIUS: int = 1 << 14
+INT32_MAX_COORDINATE: int = (1 << 31) - 1
+INT64_MAX_BEZIER_COORDINATE: int = 1 << 40
+
+LineArgs = tuple[int, int, int, int]
+CircleArgs = tuple[int, int, int]
+BezierArgs = tuple[int, ...]
+
+# Every native backend is compared pixel-for-pixel against the reference implementation of its shape
+LINE_BACKENDS: dict[str, Callable[..., list[tuple[int, int]]]] = {"Line": rasterization.Line}
+CIRCLE_BACKENDS: dict[str, Callable[..., list[tuple[int, int]]]] = {"Circle": rasterization.Circle}
+
+# Batch backends rasterize every generated shape in a single call, returning (points, offsets)
+LINE_BATCH_BACKENDS: dict[str, Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]] = {"Lines": rasterization.Lines}
+CIRCLE_BATCH_BACKENDS: dict[str, Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]] = {"Circles": rasterization.Circles}  # noqa: E501
+
+# Beziers have no reference implementation, so their paths are only checked for the properties every path must have
+BEZIER_BACKENDS: dict[int, tuple[Callable[..., list[tuple[int, int]]], Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]]] = \
+    {2: (rasterization.QuadBezier, rasterization.QuadBeziers), 3: (rasterization.CubicBezier, rasterization.CubicBeziers)}  # noqa: E501
+
+
+def reference_line(x_1: int, y_1: int, x_2: int, y_2: int) -> list[tuple[int, int]]:
+
+    return [(x, y) for x, y in py_impl_line(x_1, y_1, x_2, y_2).tolist()]
+
+
+def reference_circle(radius: int, x_c: int, y_c: int) -> list[tuple[int, int]]:
+
+    return [(x, y) for x, y in py_impl_circle(radius, (x_c, y_c)).tolist()]
+
+
+def random_line(rng: random.Random, max_length: int) -> LineArgs:
+
+    origin_limit: int = rng.choice([64, INT32_MAX_LINE_COORDINATE, INT64_MAX_LINE_COORDINATE - max_length])
+    x_1: int = rng.randint(-origin_limit, origin_limit)
+    y_1: int = rng.randint(-origin_limit, origin_limit)
+
+    length: int = rng.randint(0, max_length)
+    delta_x: int
+    delta_y: int
+
+    match rng.choice(["general", "point", "horizontal", "vertical", "diagonal"]):
+        case "general":
+            delta_x, delta_y = rng.randint(-length, length), rng.randint(-length, length)
+        case "point":
+            delta_x, delta_y = 0, 0
+        case "horizontal":
+            delta_x, delta_y = rng.choice([-length, length]), 0
+        case "vertical":
+            delta_x, delta_y = 0, rng.choice([-length, length])
+        case "diagonal":
+            delta_x, delta_y = rng.choice([-length, length]), rng.choice([-length, length])
+
+    return (x_1, y_1, x_1 + delta_x, y_1 + delta_y)
+
+
+def random_circle(rng: random.Random, max_radius: int) -> CircleArgs:
+
+    radius: int = rng.choice([0, 1, 2, rng.randint(0, max_radius)])
+    center_limit: int = rng.choice([64, INT32_MAX_COORDINATE - radius, INT64_MAX_LINE_COORDINATE])
+
+    return (radius, rng.randint(-center_limit, center_limit), rng.randint(-center_limit, center_limit))
+
+
+def random_bezier(rng: random.Random, degree: int, max_length: int) -> BezierArgs:
+
+    origin_limit: int = rng.choice([64, INT32_MAX_LINE_COORDINATE, INT64_MAX_BEZIER_COORDINATE - max_length])
+    x_0: int = rng.randint(-origin_limit, origin_limit)
+    y_0: int = rng.randint(-origin_limit, origin_limit)
+
+    # Collapsing the control polygon onto a point or a line exercises the degenerate curves
+    spread: int = rng.choice([0, 1, max_length])
+    collinear: bool = rng.random() < 0.1
+
+    return tuple(coordinate
+                 for t in range(degree + 1)
+                 for coordinate in ((x_0 + t, y_0 + t) if collinear else
+                                    (x_0 + rng.randint(0, spread), y_0 + rng.randint(0, spread))))
+
+
+def edge_case_lines() -> list[LineArgs]:
+
+    # Lines straddling the switch from the 32-bit path to the 64-bit path
+    return [(INT32_MAX_LINE_COORDINATE - 5, 0, INT32_MAX_LINE_COORDINATE, 3),
+            (INT32_MAX_LINE_COORDINATE - 5, 0, INT32_MAX_LINE_COORDINATE + 1, 3),
+            (-INT32_MAX_LINE_COORDINATE, -INT32_MAX_LINE_COORDINATE, -INT32_MAX_LINE_COORDINATE + 7, -INT32_MAX_LINE_COORDINATE + 2),  # noqa: E501
+            (-INT32_MAX_LINE_COORDINATE - 1, 0, -INT32_MAX_LINE_COORDINATE + 7, -2),
+            (INT64_MAX_LINE_COORDINATE - 9, -INT64_MAX_LINE_COORDINATE, INT64_MAX_LINE_COORDINATE, -INT64_MAX_LINE_COORDINATE + 4)]  # noqa: E501
+
+
+def edge_case_circles() -> list[CircleArgs]:
+
+    # Circles straddling the switch from the 32-bit path to the 64-bit path
+    return [(INT32_MAX_CIRCLE_RADIUS, 0, 0),
+            (INT32_MAX_CIRCLE_RADIUS + 1, 0, 0),
+            (10, INT32_MAX_COORDINATE - 10, -INT32_MAX_COORDINATE + 10),
+            (10, INT32_MAX_COORDINATE - 9, 0)]
+
+
+def compare(shapes: Sequence[tuple[int, ...]],
+            reference: Callable[..., list[tuple[int, int]]],
+            backends: dict[str, Callable[..., list[tuple[int, int]]]],
+            batch_backends: dict[str, Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]]) -> list[str]:
+
+    expected_shapes: list[list[tuple[int, int]]] = [reference(*shape_args) for shape_args in shapes]
+
+    mismatches: list[str] = []
+    for name, backend in backends.items():
+        for shape_args, expected_points in zip(shapes, expected_shapes):
+            if backend(*shape_args) != expected_points:
+                mismatches.append(f"{name:s}{shape_args}")
+
+    points: np.ndarray
+    offsets: np.ndarray
+    for name, batch_backend in batch_backends.items():
+        points, offsets = batch_backend(np.array(shapes, dtype=np.int64))
+        for n, (shape_args, expected_points) in enumerate(zip(shapes, expected_shapes)):
+            if [(x, y) for x, y in points[offsets[n]:offsets[n + 1]].tolist()] != expected_points:
+                mismatches.append(f"{name:s}[{n:d}]{shape_args}")
+
+    return mismatches
+
+
+def check_beziers(beziers: Sequence[BezierArgs],
+                  backend: Callable[..., list[tuple[int, int]]],
+                  batch_backend: Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]) -> list[str]:
+
+    points: np.ndarray
+    offsets: np.ndarray
+    points, offsets = batch_backend(np.array(beziers, dtype=np.int64))
+
+    mismatches: list[str] = []
+    for n, bezier_args in enumerate(beziers):
+        path: list[tuple[int, int]] = backend(*bezier_args)
+        if path[0] != bezier_args[:2] or path[-1] != bezier_args[-2:]:
+            mismatches.append(f"{backend.__name__:s}{bezier_args} does not join its end points")
+        if any(max(abs(x_2 - x_1), abs(y_2 - y_1)) != 1 for (x_1, y_1), (x_2, y_2) in zip(path, path[1:])):
+            mismatches.append(f"{backend.__name__:s}{bezier_args} is not 8-connected")
+        if [(x, y) for x, y in points[offsets[n]:offsets[n + 1]].tolist()] != path:
+            mismatches.append(f"{batch_backend.__name__:s}[{n:d}]{bezier_args}")
+
+    return mismatches
+
+
+def fuzz(seed: int,
+         iterations: int,
+         max_length: int,
+         max_radius: int) -> list[str]:
+
+    rng: random.Random = random.Random(seed)
+
+    lines: list[LineArgs] = edge_case_lines() + [random_line(rng, max_length) for _ in range(iterations)]
+    circles: list[CircleArgs] = edge_case_circles() + [random_circle(rng, max_radius) for _ in range(iterations)]
+
+    beziers: dict[int, list[BezierArgs]] = \
+        {degree: [random_bezier(rng, degree, max_length) for _ in range(iterations)] for degree in BEZIER_BACKENDS}
+
+    return compare(lines, reference_line, LINE_BACKENDS, LINE_BATCH_BACKENDS) + \
+           compare(circles, reference_circle, CIRCLE_BACKENDS, CIRCLE_BATCH_BACKENDS) + \
+           [mismatch for degree, (backend, batch_backend) in BEZIER_BACKENDS.items()  # noqa: E127
+            for mismatch in check_beziers(beziers[degree], backend, batch_backend)]
+
+
+if (__name__ == "__main__"):
+
+    parser = \
+        argparse.ArgumentParser(prog="RasterizationFuzz",
+                                description="Differential fuzzing of the native Rasterization backends against the reference implementations")  # noqa: E501
+
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--max-length", type=int, default=300)
+    parser.add_argument("--max-radius", type=int, default=300)
+    args: argparse.Namespace = parser.parse_args()
+
+    mismatches: list[str] = fuzz(args.seed,
+                                 args.iterations,
+                                 args.max_length,
+                                 args.max_radius)
+
+    for mismatch in mismatches:
+        print(f"Mismatch: {mismatch:s}")
+    print(f"{len(mismatches):d} mismatches (seed {args.seed:d})")
+
+    sys.exit(1 if mismatches else 0)
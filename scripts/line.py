@@ -6,50 +6,13 @@ import argparse
 import subprocess
 import os
 import rasterization
+from reference import py_impl_line  # noqa: F401
 
 
 matplotlib.use("Agg")
 plt.rcParams['text.usetex'] = True
 
 
-def py_impl_line(x_1: int, y_1: int,
-                 x_2: int, y_2: int) -> np.ndarray[tuple[int, int], np.dtype[Any]]:
-
-    delta_x: int = x_2 - x_1
-    delta_y: int = y_2 - y_1
-
-    non_steep: bool = abs(delta_x) > abs(delta_y)
-
-    delta_I: int = delta_x if non_steep else delta_y
-    delta_O: int = delta_y if non_steep else delta_x
-    O_1: int = y_1 if non_steep else x_1
-    O_2: int = y_2 if non_steep else x_2
-    orthogonal_axis: int = 1 if non_steep else 0
-
-    sgn_delta_x: int = np.sign(delta_x)
-    sgn_delta_y: int = np.sign(delta_y)
-    sgn_delta_O: int = np.sign(delta_O)
-
-    N: int = abs(delta_I)
-    T: int = N - 2*sgn_delta_O*((N - 1)*O_1 + O_2)
-
-    points: np.ndarray[tuple[int, int], np.dtype[Any]] = np.empty((N + 1, 2), dtype=int)
-    points[0] = (x_1, y_1)
-    points[N] = (x_2, y_2)
-
-    decision: bool
-
-    for n in range(0, N - 1):
-
-        decision = 2*sgn_delta_O*(n*delta_O - N*points[n][orthogonal_axis]) >= T
-
-        points[n + 1] = \
-            (points[n][0] + sgn_delta_x*(1 if     non_steep or decision else 0),  # noqa: E271
-             points[n][1] + sgn_delta_y*(1 if not non_steep or decision else 0))
-
-    return points
-
-
 def plot_line_rasterization(x_1: int, y_1: int,
                             x_2: int, y_2: int,
                             x_inches: int,
@@ -0,0 +1,155 @@
+import numpy as np
+from typing import Any
+
+
+def py_impl_line(x_1: int, y_1: int,
+                 x_2: int, y_2: int) -> np.ndarray[tuple[int, int], np.dtype[Any]]:
+
+    delta_x: int = x_2 - x_1
+    delta_y: int = y_2 - y_1
+
+    non_steep: bool = abs(delta_x) > abs(delta_y)
+
+    delta_I: int = delta_x if non_steep else delta_y
+    delta_O: int = delta_y if non_steep else delta_x
+    O_1: int = y_1 if non_steep else x_1
+    O_2: int = y_2 if non_steep else x_2
+    orthogonal_axis: int = 1 if non_steep else 0
+
+    sgn_delta_x: int = int(np.sign(delta_x))
+    sgn_delta_y: int = int(np.sign(delta_y))
+    sgn_delta_O: int = int(np.sign(delta_O))
+
+    N: int = abs(delta_I)
+    T: int = N - 2*sgn_delta_O*((N - 1)*O_1 + O_2)
+
+    points: np.ndarray[tuple[int, int], np.dtype[Any]] = np.empty((N + 1, 2), dtype=object)
+    points[0] = (x_1, y_1)
+    points[N] = (x_2, y_2)
+
+    decision: bool
+
+    for n in range(0, N - 1):
+
+        decision = 2*sgn_delta_O*(n*delta_O - N*points[n][orthogonal_axis]) >= T
+
+        points[n + 1] = \
+            (points[n][0] + sgn_delta_x*(1 if     non_steep or decision else 0),  # noqa: E271
+             points[n][1] + sgn_delta_y*(1 if not non_steep or decision else 0))
+
+    return points
+
+
+def py_impl_circle(radius: int,
+                   center: tuple[int, int]) -> np.ndarray[tuple[int, int], np.dtype[Any]]:
+
+    if radius == 0:
+        return np.array([center], dtype=object)
+
+    N: int = int(np.floor(radius/np.sqrt(2))) + 1
+    tau: int = 4*np.square(radius) - 5
+
+    first_octant_points: np.ndarray[tuple[int, int], np.dtype[Any]] = np.empty((N, 2), dtype=object)
+    first_octant_points[0] = (radius, 0)
+
+    decrement: bool
+
+    for n in range(0, N - 1):
+
+        decrement = 4*(np.square(first_octant_points[n][0]) - first_octant_points[n][0] + np.square(n) + 2*n) >= tau
+
+        first_octant_points[n + 1] = \
+            (first_octant_points[n][0] - (1 if decrement else 0),
+             first_octant_points[n][1] + 1)
+
+    overflow: int = 1 if first_octant_points[N - 1][0] == first_octant_points[N - 1][1] else 0
+    M: int = N - overflow
+    Q: int = 2*N - 1 - overflow
+
+    points: np.ndarray[tuple[int, int], np.dtype[Any]] = np.empty((4*Q, 2), dtype=object)
+
+    # Right-most point
+    points[0] = \
+        (first_octant_points[0][0] + center[0],
+         first_octant_points[0][1] + center[1])
+
+    # Upper-most point
+    points[Q] = \
+        (first_octant_points[0][1] + center[0],
+         first_octant_points[0][0] + center[1])
+
+    # Left-most point
+    points[2*Q] = \
+        (-first_octant_points[0][0] + center[0],
+          first_octant_points[0][1] + center[1])  # noqa: E127
+
+    # Bottom-most point
+    points[3*Q] = \
+        (-first_octant_points[0][1] + center[0],
+         -first_octant_points[0][0] + center[1])
+
+    if overflow == 1:
+
+        # Upper-left diagonal point
+        points[N - 1] = \
+            (first_octant_points[N - 1][0] + center[0],
+             first_octant_points[N - 1][1] + center[1])
+
+        # Upper-right diagonal point
+        points[2*Q - (N - 1)] = \
+            (-first_octant_points[N - 1][0] + center[0],
+              first_octant_points[N - 1][1] + center[1])  # noqa: E127
+
+        # Lower-right diagonal point
+        points[2*Q + (N - 1)] = \
+            (-first_octant_points[N - 1][0] + center[0],
+             -first_octant_points[N - 1][1] + center[1])
+
+        # Lower-left diagonal point
+        points[4*Q - (N - 1)] = \
+            ( first_octant_points[N - 1][0] + center[0],  # noqa: E201
+             -first_octant_points[N - 1][1] + center[1])  # noqa: E128
+
+    for m in range(1, M):
+
+        # First Octant
+        points[m] = \
+            (first_octant_points[m][0] + center[0],
+             first_octant_points[m][1] + center[1])
+
+        # Second Octant
+        points[Q - m] = \
+            (first_octant_points[m][1] + center[0],
+             first_octant_points[m][0] + center[1])
+
+        # Third Octant
+        points[Q + m] = \
+            (-first_octant_points[m][1] + center[0],
+              first_octant_points[m][0] + center[1])  # noqa: E127
+
+        # Fourth Octant
+        points[2*Q - m] = \
+            (-first_octant_points[m][0] + center[0],
+              first_octant_points[m][1] + center[1])  # noqa: E127
+
+        # Fifth Octant
+        points[2*Q + m] = \
+            (-first_octant_points[m][0] + center[0],
+             -first_octant_points[m][1] + center[1])
+
+        # Sixth Octant
+        points[3*Q - m] = \
+            (-first_octant_points[m][1] + center[0],
+             -first_octant_points[m][0] + center[1])
+
+        # Seventh Octant
+        points[3*Q + m] = \
+            ( first_octant_points[m][1] + center[0],  # noqa: E201
+             -first_octant_points[m][0] + center[1])  # noqa: E128
+
+        # Eighth Octant
+        points[4*Q - m] = \
+            ( first_octant_points[m][0] + center[0],  # noqa: E201
+             -first_octant_points[m][1] + center[1])  # noqa: E128
+
+    return points
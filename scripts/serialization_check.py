@@ -0,0 +1,152 @@
+import sys
+import random
+import argparse
+import tempfile
+import itertools
+from pathlib import Path
+import numpy as np
+import rasterization
+from rasterization.serialization import Shapes, save_shapes, load_shapes
+
+
+def random_shapes(rng: random.Random, count: int, max_length: int) -> tuple[np.ndarray, np.ndarray]:
+
+    # Lines far from the origin need the widest stored coordinates, and empty shapes are spliced in between them
+    endpoints: np.ndarray = \
+        np.array([(x, y, x + rng.randint(-max_length, max_length), y + rng.randint(-max_length, max_length))
+                  for x, y in ((rng.randint(-1 << 40, 1 << 40), rng.randint(-1 << 40, 1 << 40)) for _ in range(count))],
+                 dtype=np.int64).reshape(-1, 4)
+    points: np.ndarray
+    offsets: np.ndarray
+    points, offsets = rasterization.Lines(endpoints)
+
+    shape_lengths: list[int] = []
+    for shape_length in np.diff(offsets).tolist():
+        shape_lengths.append(shape_length)
+        if rng.random() < 0.2:
+            shape_lengths.append(0)
+
+    return points, np.concatenate([[0], np.cumsum(shape_lengths, dtype=np.int64)])
+
+
+def check_round_trip(path: Path,
+                     points: np.ndarray,
+                     offsets: np.ndarray,
+                     delta_encoded: bool,
+                     compressed: bool,
+                     narrowed: bool) -> tuple[Shapes, list[str]]:
+
+    name: str = f"{len(offsets) - 1:d} shapes with delta_encoded={delta_encoded}, compressed={compressed}, narrowed={narrowed}"  # noqa: E501
+    save_shapes(path, points, offsets, delta_encoded, compressed, narrowed)
+    shapes: Shapes = load_shapes(path)
+
+    failures: list[str] = []
+    if len(shapes) != len(offsets) - 1 or not np.array_equal(shapes.offsets, offsets):
+        failures.append(f"{name:s}: offsets differ")
+    if shapes.points.dtype != np.int64 or not np.array_equal(shapes.points, points.reshape(-1, 2)):
+        failures.append(f"{name:s}: points differ")
+
+    for n in itertools.chain(range(len(shapes)), range(-len(shapes), 0)):
+        shape_points: np.ndarray = shapes[n]
+        if shape_points.dtype != np.int64 or \
+           not np.array_equal(shape_points, points[offsets[n % len(shapes)]:offsets[n % len(shapes) + 1]]):
+            failures.append(f"{name:s}: shape {n:d} differs")
+
+    for n in (len(shapes), -len(shapes) - 1):
+        try:
+            shapes[n]
+            failures.append(f"{name:s}: shape {n:d} did not raise IndexError")
+        except IndexError:
+            pass
+
+    window_points: np.ndarray
+    window_offsets: np.ndarray
+    for start, stop in ((0, len(shapes)), (len(shapes)//3, 2*len(shapes)//3), (len(shapes), len(shapes))):
+        window_points, window_offsets = shapes.decode(start, stop)
+        if not np.array_equal(window_offsets, offsets[start:stop + 1] - offsets[start]) or \
+           not np.array_equal(window_points, points[offsets[start]:offsets[stop]]):
+            failures.append(f"{name:s}: window {start:d}:{stop:d} differs")
+
+    if not (delta_encoded or compressed or narrowed) and shapes.points.base is None:
+        failures.append(f"{name:s}: points are a copy rather than a view of the file")
+
+    return shapes, failures
+
+
+def check_close(path: Path, points: np.ndarray, offsets: np.ndarray) -> list[str]:
+
+    save_shapes(path, points, offsets)
+
+    failures: list[str] = []
+    with load_shapes(path) as shapes:
+        if not np.array_equal(shapes.points, points):
+            failures.append("points of a Shapes used as a context manager differ")
+
+    try:
+        len(shapes)
+        failures.append("a closed Shapes did not raise ValueError")
+    except ValueError:
+        pass
+
+    return failures
+
+
+def check(seed: int,
+          count: int,
+          max_length: int) -> list[str]:
+
+    rng: random.Random = random.Random(seed)
+
+    cases: list[tuple[np.ndarray, np.ndarray]] = \
+        [random_shapes(rng, count, max_length),
+         random_shapes(rng, 3, 0),
+         (np.empty((0, 2), dtype=np.int64), np.zeros(4, dtype=np.int64)),
+         (np.empty((0, 2), dtype=np.int64), np.zeros(1, dtype=np.int64))]
+
+    failures: list[str] = []
+    with tempfile.TemporaryDirectory() as directory:
+
+        # Every file is saved over the same path while the earlier ones are still mapped, as worker processes would
+        opened: list[tuple[Shapes, np.ndarray]] = []
+        shapes: Shapes
+        shape_failures: list[str]
+        for points, offsets in cases:
+            for delta_encoded, compressed, narrowed in itertools.product((False, True), repeat=3):
+                shapes, shape_failures = check_round_trip(Path(directory)/"shapes.bin",
+                                                          points,
+                                                          offsets,
+                                                          delta_encoded,
+                                                          compressed,
+                                                          narrowed)
+                failures += shape_failures
+                opened.append((shapes, points))
+
+        for n, (shapes, points) in enumerate(opened):
+            if not np.array_equal(shapes.decode(0, len(shapes))[0], points):
+                failures.append(f"file {n:d} changed after being saved over")
+
+        failures += check_close(Path(directory)/"closed.bin", *cases[0])
+
+    return failures
+
+
+if (__name__ == "__main__"):
+
+    parser = \
+        argparse.ArgumentParser(prog="RasterizationSerializationCheck",
+                                description="Round trips of rasterized shapes through the binary shapes file format")
+
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--max-length", type=int, default=300)
+    args: argparse.Namespace = parser.parse_args()
+
+    failures: list[str] = check(args.seed,
+                                args.count,
+                                args.max_length)
+
+    for failure in failures:
+        print(f"Failure: {failure:s}")
+    print(f"{len(failures):d} failures (seed {args.seed:d})")
+
+    sys.exit(1 if failures else 0)
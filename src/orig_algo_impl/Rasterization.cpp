@@ -3,22 +3,23 @@
 # include "Rasterization.hpp" 
 
 
-std::vector<std::array<int, 2>> Horizontal_Line(const std::array<std::array<int, 2>, 2>& line_points)
+template <typename coord_t>
+std::vector<std::array<coord_t, 2>> Horizontal_Line(const std::array<std::array<coord_t, 2>, 2>& line_points)
 {
     const auto& [p_1, p_2] = line_points;
     const auto& [x_1, y_1] = p_1;
     const auto& [x_2, y_2] = p_2;
 
-    int y {y_1};
-    int delta_x {x_2 - x_1};
-    int sgn_delta_x {delta_x >= 0 ? 1 : -1};
+    coord_t y {y_1};
+    coord_t delta_x {x_2 - x_1};
+    coord_t sgn_delta_x {delta_x >= 0 ? 1 : -1};
     std::size_t N {static_cast<std::size_t>(std::abs(delta_x))};
 
-    std::vector<std::array<int, 2>> points (N + 1);
+    std::vector<std::array<coord_t, 2>> points (N + 1);
 
     points[0] = {x_1, y};
     points[N] = {x_2, y}; 
-    for(std::size_t n {0}; n < N - 1; n++){
+    for(std::size_t n {0}; n + 1 < N; n++){
         points[n + 1] = {points[n][0] + sgn_delta_x, y}; 
     }
 
@@ -26,22 +27,23 @@ std::vector<std::array<int, 2>> Horizontal_Line(const std::array<std::array<int,
 }
 
 
-std::vector<std::array<int, 2>> Vertical_Line(const std::array<std::array<int, 2>, 2>& line_points)
+template <typename coord_t>
+std::vector<std::array<coord_t, 2>> Vertical_Line(const std::array<std::array<coord_t, 2>, 2>& line_points)
 {
     const auto& [p_1, p_2] = line_points;
     const auto& [x_1, y_1] = p_1;
     const auto& [x_2, y_2] = p_2;
 
-    int x {x_1};
-    int delta_y {y_2 - y_1};
-    int sgn_delta_y {delta_y >= 0 ? 1 : -1};
+    coord_t x {x_1};
+    coord_t delta_y {y_2 - y_1};
+    coord_t sgn_delta_y {delta_y >= 0 ? 1 : -1};
     std::size_t N {static_cast<std::size_t>(std::abs(delta_y))};
 
-    std::vector<std::array<int, 2>> points (N + 1);
+    std::vector<std::array<coord_t, 2>> points (N + 1);
 
     points[0] = {x, y_1};
     points[N] = {x, y_2};
-    for(std::size_t n {0}; n < N - 1; n++){
+    for(std::size_t n {0}; n + 1 < N; n++){
         points[n + 1] = {x, points[n][1] + sgn_delta_y};
     }
 
@@ -49,19 +51,20 @@ std::vector<std::array<int, 2>> Vertical_Line(const std::array<std::array<int, 2
 }
 
 
-std::vector<std::array<int, 2>> Diagonal_Line(const std::array<std::array<int, 2>, 2>& line_points)
+template <typename coord_t>
+std::vector<std::array<coord_t, 2>> Diagonal_Line(const std::array<std::array<coord_t, 2>, 2>& line_points)
 {
     const auto& [p_1, p_2] = line_points;
     const auto& [x_1, y_1] = p_1;
     const auto& [x_2, y_2] = p_2;
 
-    int delta_x {x_2 - x_1};
-    int delta_y {y_2 - y_1};
-    int sgn_delta_x {delta_x >= 0 ? 1 : -1};
-    int sgn_delta_y {delta_y >= 0 ? 1 : -1};
+    coord_t delta_x {x_2 - x_1};
+    coord_t delta_y {y_2 - y_1};
+    coord_t sgn_delta_x {delta_x >= 0 ? 1 : -1};
+    coord_t sgn_delta_y {delta_y >= 0 ? 1 : -1};
     std::size_t N {static_cast<std::size_t>(std::abs(delta_x))};
 
-    std::vector<std::array<int, 2>> points (N + 1);
+    std::vector<std::array<coord_t, 2>> points (N + 1);
 
     points[0] = {x_1, y_1};
     points[N] = {x_2, y_2};
@@ -75,74 +78,100 @@ std::vector<std::array<int, 2>> Diagonal_Line(const std::array<std::array<int, 2
 }
 
 
-std::vector<std::array<int, 2>> Rasterization::Line(const std::array<std::array<int, 2>, 2>& line_points)
+// Bresenham error accumulator for one octant: error_n = 2(n + 1)|delta_O| - 2N|O[n] - O[0]| - N
+template <typename coord_t, bool non_steep, coord_t sgn_delta_x, coord_t sgn_delta_y>
+void Octant_Line(const std::array<std::array<coord_t, 2>, 2>& line_points,
+                 std::array<coord_t, 2>* point)
 {
     const auto& [p_1, p_2] = line_points;
     const auto& [x_1, y_1] = p_1;
     const auto& [x_2, y_2] = p_2;
 
-    int delta_x {x_2 - x_1};
-    int delta_y {y_2 - y_1};
+    coord_t N {non_steep ? sgn_delta_x*(x_2 - x_1) : sgn_delta_y*(y_2 - y_1)};
+    coord_t abs_delta_O {non_steep ? sgn_delta_y*(y_2 - y_1) : sgn_delta_x*(x_2 - x_1)};
 
-    int abs_delta_x {std::abs(delta_x)};
-    int abs_delta_y {std::abs(delta_y)};
+    coord_t x {x_1};
+    coord_t y {y_1};
+    coord_t error {2*abs_delta_O - N};
 
-    if(delta_x == 0) {
-        return Vertical_Line(line_points);
-    } else if (delta_y == 0) {
-        return Horizontal_Line(line_points);
-    } else if (abs_delta_x == abs_delta_y) {
-       return Diagonal_Line(line_points); 
-    } else {
+    *point++ = {x, y};
+    for(coord_t n {1}; n < N; n++) {
 
-        bool non_steep {abs_delta_x > abs_delta_y};
+        if constexpr (non_steep) { x += sgn_delta_x; } else { y += sgn_delta_y; }
 
-        int delta_I {non_steep ? delta_x : delta_y};
-        int delta_O {non_steep ? delta_y : delta_x};
-        int O_1 {non_steep ? y_1 : x_1};
-        int O_2 {non_steep ? y_2 : x_2};
-        std::size_t orthogonal_axis {static_cast<std::size_t>(non_steep ? 1: 0)};
+        if(error >= 0) {
+            if constexpr (non_steep) { y += sgn_delta_y; } else { x += sgn_delta_x; }
+            error -= 2*N;
+        }
+        error += 2*abs_delta_O;
 
-        int sgn_delta_x {delta_x >= 0 ? 1 : -1};
-        int sgn_delta_y {delta_y >= 0 ? 1 : -1};
-        int sgn_delta_O {delta_O >= 0 ? 1 : -1};
+        *point++ = {x, y};
+    }
+    *point = {x_2, y_2};
+}
 
-        std::size_t N {static_cast<std::size_t>(std::abs(delta_I))};
-        int T {static_cast<int>(N) - 2*sgn_delta_O*((static_cast<int>(N) - 1)*O_1 + O_2)};
 
-        std::vector<std::array<int, 2>> points (N + 1);
-        points[0] = {x_1, y_1};
-        points[N] = {x_2, y_2};
+template <typename coord_t>
+std::vector<std::array<coord_t, 2>> Rasterization::Line(const std::array<std::array<coord_t, 2>, 2>& line_points)
+{
+    const auto& [p_1, p_2] = line_points;
+    const auto& [x_1, y_1] = p_1;
+    const auto& [x_2, y_2] = p_2;
 
-        bool decision;
+    coord_t delta_x {x_2 - x_1};
+    coord_t delta_y {y_2 - y_1};
 
-        for(std::size_t n{0}; n <= N - 2; n++) {
-        
-            decision = (sgn_delta_O*(static_cast<int>(n)*delta_O - static_cast<int>(N)*points[n][orthogonal_axis]) << 1) >= T;
+    coord_t abs_delta_x {std::abs(delta_x)};
+    coord_t abs_delta_y {std::abs(delta_y)};
 
-            points[n + 1] = \
-                {points[n][0] + sgn_delta_x*(    non_steep || decision ? 1 : 0),
-                 points[n][1] + sgn_delta_y*(not non_steep || decision ? 1 : 0)};
-        } 
+    if(delta_x == 0) {
+        return Vertical_Line<coord_t>(line_points);
+    } else if (delta_y == 0) {
+        return Horizontal_Line<coord_t>(line_points);
+    } else if (abs_delta_x == abs_delta_y) {
+       return Diagonal_Line<coord_t>(line_points); 
+    } else {
+
+        // Indexed by 4*non_steep + 2*(delta_x < 0) + (delta_y < 0)
+        constexpr std::array<void(*)(const std::array<std::array<coord_t, 2>, 2>&, std::array<coord_t, 2>*), 8> octant_kernels \
+            {Octant_Line<coord_t, false,  1,  1>,
+             Octant_Line<coord_t, false,  1, -1>,
+             Octant_Line<coord_t, false, -1,  1>,
+             Octant_Line<coord_t, false, -1, -1>,
+             Octant_Line<coord_t, true,   1,  1>,
+             Octant_Line<coord_t, true,   1, -1>,
+             Octant_Line<coord_t, true,  -1,  1>,
+             Octant_Line<coord_t, true,  -1, -1>};
+
+        bool non_steep {abs_delta_x > abs_delta_y};
+        std::size_t N {static_cast<std::size_t>(non_steep ? abs_delta_x : abs_delta_y)};
+
+        std::size_t octant {4*static_cast<std::size_t>(non_steep) + 2*static_cast<std::size_t>(delta_x < 0) + static_cast<std::size_t>(delta_y < 0)};
+
+        std::vector<std::array<coord_t, 2>> points (N + 1);
+        octant_kernels[octant](line_points, points.data());
 
         return points;
     }
 }
 
 
-std::vector<std::array<int, 2>> Rasterization::Circle(int radius,
-                                                      const std::array<int, 2>& center)
+template <typename coord_t>
+std::vector<std::array<coord_t, 2>> Rasterization::Circle(coord_t radius,
+                                                          const std::array<coord_t, 2>& center)
 {
-    std::size_t N {static_cast<std::size_t>(radius/std::sqrt(2)) + 1};
-    int tau {4*radius*radius - 5};
+    if(radius == 0) { return {center}; }
 
-    std::vector<std::array<int, 2>> first_octant_points (N);
+    std::size_t N {static_cast<std::size_t>(static_cast<double>(radius)/std::sqrt(2)) + 1};
+    coord_t tau {4*radius*radius - 5};
+
+    std::vector<std::array<coord_t, 2>> first_octant_points (N);
     first_octant_points[0] = {radius, 0};
 
     bool decrement;
     for (std::size_t n {0}; n < N - 1; n++) {
 
-        decrement = 4*(first_octant_points[n][0]*first_octant_points[n][0] - first_octant_points[n][0] + static_cast<int>(n*n) + 2*static_cast<int>(n)) >= tau;
+        decrement = 4*(first_octant_points[n][0]*first_octant_points[n][0] - first_octant_points[n][0] + static_cast<coord_t>(n*n) + 2*static_cast<coord_t>(n)) >= tau;
 
         first_octant_points[n + 1] = 
            {first_octant_points[n][0] - (decrement ? 1 : 0),
@@ -154,7 +183,7 @@ std::vector<std::array<int, 2>> Rasterization::Circle(int radius,
     std::size_t M {N - overflow};
     std::size_t Q {2*N - 1 - overflow};
 
-    std::vector<std::array<int, 2>> circular_arc_points (4*Q);
+    std::vector<std::array<coord_t, 2>> circular_arc_points (4*Q);
 
     circular_arc_points[0] = \
         {first_octant_points[0][0] + center[0],
@@ -229,6 +258,183 @@ std::vector<std::array<int, 2>> Rasterization::Circle(int radius,
 
     return circular_arc_points;
 } 
+
+
+// Position and forward differences of the polynomial coefficients[3]*t^3 + ... + coefficients[0] for a step of h
+struct Forward_Differences
+{
+    std::array<double, 2> p;
+    std::array<double, 2> d_1;
+    std::array<double, 2> d_2;
+    std::array<double, 2> d_3;
+};
+
+
+Forward_Differences Forward_Differences_At(const std::array<std::array<double, 2>, 4>& coefficients,
+                                           double t,
+                                           double h)
+{
+    Forward_Differences differences {};
+
+    for(std::size_t axis {0}; axis < 2; axis++) {
+
+        double a {coefficients[3][axis]};
+        double b {coefficients[2][axis]};
+        double c {coefficients[1][axis]};
+        double d {coefficients[0][axis]};
+
+        differences.p[axis] = ((a*t + b)*t + c)*t + d;
+        differences.d_1[axis] = a*(3*t*t*h + 3*t*h*h + h*h*h) + b*(2*t*h + h*h) + c*h;
+        differences.d_2[axis] = a*(6*t*h*h + 6*h*h*h) + 2*b*h*h;
+        differences.d_3[axis] = 6*a*h*h*h;
+    }
+
+    return differences;
+}
+
+
+template <typename coord_t>
+coord_t Chebyshev_Distance(const std::array<coord_t, 2>& p_1, const std::array<coord_t, 2>& p_2)
+{
+    return std::max(std::abs(p_1[0] - p_2[0]), std::abs(p_1[1] - p_2[1]));
+}
+
+
+// Adaptive forward differencing: the step is halved whenever it would skip a pixel and doubled whenever it
+// moves less than half a pixel, so every accepted step lands on the current pixel or one of its 8 neighbours
+template <typename coord_t>
+std::vector<std::array<coord_t, 2>> Bezier_Curve(const std::array<std::array<double, 2>, 4>& coefficients,
+                                                 const std::array<coord_t, 2>& p_start,
+                                                 const std::array<coord_t, 2>& p_end,
+                                                 double max_speed)
+{
+    // t is tracked exactly as t_n/2^K, with 2^K large enough for the smallest step to move less than half a pixel
+    int K {max_speed > 0.5 ? std::ilogb(max_speed) + 2 : 0};
+    std::uint64_t T {std::uint64_t {1} << K};
+
+    std::uint64_t t_n {0};
+    std::uint64_t step {std::max(T >> 4, std::uint64_t {1})};
+    std::size_t steps_since_anchor {0};
+    Forward_Differences differences {};
+
+    // Re-deriving the differences from the polynomial keeps the accumulated rounding error from drifting
+    auto anchor = [&](std::uint64_t new_step) {
+        step = new_step;
+        steps_since_anchor = 0;
+        differences = Forward_Differences_At(coefficients,
+                                             std::ldexp(static_cast<double>(t_n), -K),
+                                             std::ldexp(static_cast<double>(step), -K));
+    };
+    anchor(step);
+
+    std::vector<std::array<coord_t, 2>> points {p_start};
+    std::array<coord_t, 2> last_pixel;
+    std::array<coord_t, 2> pixel;
+    std::array<double, 2> p_next;
+
+    while(t_n < T) {
+
+        auto& [p, d_1, d_2, d_3] = differences;
+
+        p_next = {p[0] + d_1[0], p[1] + d_1[1]};
+        pixel = t_n + step == T ? p_end : std::array<coord_t, 2> {static_cast<coord_t>(std::llround(p_next[0])),
+                                                                 static_cast<coord_t>(std::llround(p_next[1]))};
+        last_pixel = points.back();
+
+        if(step > 1 && Chebyshev_Distance(pixel, last_pixel) > 1) {
+            anchor(step >> 1);
+            continue;
+        }
+
+        t_n += step;
+        p = p_next;
+        d_1 = {d_1[0] + d_2[0], d_1[1] + d_2[1]};
+        d_2 = {d_2[0] + d_3[0], d_2[1] + d_3[1]};
+        steps_since_anchor++;
+
+        if(pixel != last_pixel) {
+            // A pixel whose neighbours already touch diagonally is a staircase corner, and is replaced
+            if(points.size() >= 2 && Chebyshev_Distance(pixel, points[points.size() - 2]) == 1) {
+                points.back() = pixel;
+            } else {
+                points.push_back(pixel);
+            }
+        }
+
+        if(std::max(std::abs(d_1[0]), std::abs(d_1[1])) < 0.5 && t_n % (2*step) == 0 && t_n + 2*step <= T) {
+            anchor(2*step);
+        } else if(steps_since_anchor == 64) {
+            anchor(step);
+        }
+    }
+
+    return points;
+}
+
+
+template <typename coord_t>
+std::vector<std::array<coord_t, 2>> Rasterization::QuadBezier(const std::array<std::array<coord_t, 2>, 3>& control_points)
+{
+    const auto& [p_1, p_2, p_3] = control_points;
+
+    std::array<std::array<double, 2>, 4> coefficients {};
+    double max_speed {0};
+
+    for(std::size_t axis {0}; axis < 2; axis++) {
+
+        double P_1 {static_cast<double>(p_1[axis])};
+        double P_2 {static_cast<double>(p_2[axis])};
+        double P_3 {static_cast<double>(p_3[axis])};
+
+        coefficients[0][axis] = P_1;
+        coefficients[1][axis] = 2*(P_2 - P_1);
+        coefficients[2][axis] = P_1 - 2*P_2 + P_3;
+
+        max_speed = std::max({max_speed, 2*std::abs(P_2 - P_1), 2*std::abs(P_3 - P_2)});
+    }
+
+    return Bezier_Curve<coord_t>(coefficients, p_1, p_3, max_speed);
+}
+
+
+template <typename coord_t>
+std::vector<std::array<coord_t, 2>> Rasterization::CubicBezier(const std::array<std::array<coord_t, 2>, 4>& control_points)
+{
+    const auto& [p_1, p_2, p_3, p_4] = control_points;
+
+    std::array<std::array<double, 2>, 4> coefficients {};
+    double max_speed {0};
+
+    for(std::size_t axis {0}; axis < 2; axis++) {
+
+        double P_1 {static_cast<double>(p_1[axis])};
+        double P_2 {static_cast<double>(p_2[axis])};
+        double P_3 {static_cast<double>(p_3[axis])};
+        double P_4 {static_cast<double>(p_4[axis])};
+
+        coefficients[0][axis] = P_1;
+        coefficients[1][axis] = 3*(P_2 - P_1);
+        coefficients[2][axis] = 3*(P_1 - 2*P_2 + P_3);
+        coefficients[3][axis] = -P_1 + 3*P_2 - 3*P_3 + P_4;
+
+        max_speed = std::max({max_speed, 3*std::abs(P_2 - P_1), 3*std::abs(P_3 - P_2), 3*std::abs(P_4 - P_3)});
+    }
+
+    return Bezier_Curve<coord_t>(coefficients, p_1, p_4, max_speed);
+}
+
+
+template std::vector<std::array<std::int32_t, 2>> Rasterization::Line(const std::array<std::array<std::int32_t, 2>, 2>& line_points);
+template std::vector<std::array<std::int64_t, 2>> Rasterization::Line(const std::array<std::array<std::int64_t, 2>, 2>& line_points);
+
+template std::vector<std::array<std::int32_t, 2>> Rasterization::Circle(std::int32_t radius, const std::array<std::int32_t, 2>& center);
+template std::vector<std::array<std::int64_t, 2>> Rasterization::Circle(std::int64_t radius, const std::array<std::int64_t, 2>& center);
+
+template std::vector<std::array<std::int32_t, 2>> Rasterization::QuadBezier(const std::array<std::array<std::int32_t, 2>, 3>& control_points);
+template std::vector<std::array<std::int64_t, 2>> Rasterization::QuadBezier(const std::array<std::array<std::int64_t, 2>, 3>& control_points);
+
+template std::vector<std::array<std::int32_t, 2>> Rasterization::CubicBezier(const std::array<std::array<std::int32_t, 2>, 4>& control_points);
+template std::vector<std::array<std::int64_t, 2>> Rasterization::CubicBezier(const std::array<std::array<std::int64_t, 2>, 4>& control_points);
  
 
 // Function only included for testing
@@ -245,11 +451,85 @@ void print_pixels(const std::vector<std::array<int, 2>>& points)
 }
 
 
+// Function only included for testing
+std::vector<std::array<long long, 2>> Reference_Line(const std::array<std::array<long long, 2>, 2>& line_points)
+{
+    const auto& [p_1, p_2] = line_points;
+    const auto& [x_1, y_1] = p_1;
+    const auto& [x_2, y_2] = p_2;
+
+    long long delta_x {x_2 - x_1};
+    long long delta_y {y_2 - y_1};
+
+    bool non_steep {std::abs(delta_x) > std::abs(delta_y)};
+
+    long long delta_I {non_steep ? delta_x : delta_y};
+    long long delta_O {non_steep ? delta_y : delta_x};
+    long long O_1 {non_steep ? y_1 : x_1};
+    long long O_2 {non_steep ? y_2 : x_2};
+    std::size_t orthogonal_axis {static_cast<std::size_t>(non_steep ? 1: 0)};
+
+    long long sgn_delta_x {delta_x >= 0 ? 1 : -1};
+    long long sgn_delta_y {delta_y >= 0 ? 1 : -1};
+    long long sgn_delta_O {delta_O >= 0 ? 1 : -1};
+
+    std::size_t N {static_cast<std::size_t>(std::abs(delta_I))};
+    long long T {static_cast<long long>(N) - 2*sgn_delta_O*((static_cast<long long>(N) - 1)*O_1 + O_2)};
+
+    std::vector<std::array<long long, 2>> points (N + 1);
+    points[0] = {x_1, y_1};
+    points[N] = {x_2, y_2};
+
+    bool decision;
+
+    for(std::size_t n{0}; n + 2 <= N; n++) {
+
+        decision = 2*sgn_delta_O*(static_cast<long long>(n)*delta_O - static_cast<long long>(N)*points[n][orthogonal_axis]) >= T;
+
+        points[n + 1] = \
+            {points[n][0] + sgn_delta_x*(    non_steep || decision ? 1 : 0),
+             points[n][1] + sgn_delta_y*(not non_steep || decision ? 1 : 0)};
+    }
+
+    return points;
+}
+
+
+// Function only included for testing
+std::size_t count_octant_mismatches(int extent)
+{
+    std::size_t mismatches {0};
+
+    for(int delta_x {-extent}; delta_x <= extent; delta_x++) {
+        for(int delta_y {-extent}; delta_y <= extent; delta_y++) {
+
+            if(delta_x == 0 || delta_y == 0 || std::abs(delta_x) == std::abs(delta_y)) { continue; }
+
+            std::array<std::array<int, 2>, 2> line_points {{{7, -3}, {7 + delta_x, -3 + delta_y}}};
+            std::vector<std::array<int, 2>> points {Rasterization::Line<int>(line_points)};
+            std::vector<std::array<long long, 2>> reference_points {Reference_Line({{{7, -3}, {7 + delta_x, -3 + delta_y}}})};
+
+            if(!std::ranges::equal(points,
+                                   reference_points,
+                                   [](const std::array<int, 2>& point, const std::array<long long, 2>& reference_point){ return point[0] == reference_point[0] && point[1] == reference_point[1]; })) {
+                fmt::print("Mismatch for ({:d}, {:d}) -> ({:d}, {:d})\n", 7, -3, 7 + delta_x, -3 + delta_y);
+                mismatches++;
+            }
+        }
+    }
+
+    return mismatches;
+}
+
+
 int main()
 {
     print_pixels(Rasterization::Circle(20, {30, 40}));
 
-    return 0;
+    std::size_t mismatches {count_octant_mismatches(64)};
+    fmt::print("\n\n{:d} mismatches between Line and the reference implementation across all 8 octants\n", mismatches);
+
+    return mismatches == 0 ? 0 : 1;
 }
 
 
@@ -4,16 +4,38 @@
 # include <cmath>
 # include <vector>
 # include <array>
+# include <limits>
+# include <cstdint>
+# include <algorithm>
 # include <iostream>  // Only included for testing purposes
-# include <algorithm>  // Only included for testing purposes
 # include <fmt/format.h>  // Only included for testing purposes
 
 namespace Rasterization
 {
-    std::vector<std::array<int, 2>> Line(const std::array<std::array<int, 2>, 2>& line_points);
+    // Largest absolute coordinate for which the error accumulator in Line fits inside coord_t
+    template <typename coord_t>
+    inline constexpr coord_t max_line_coordinate {static_cast<coord_t>(coord_t{1} << (std::numeric_limits<coord_t>::digits - 4))};
 
-    std::vector<std::array<int, 2>> Circle(int radius,
-                                           const std::array<int, 2>& center);
+    // Largest radius for which every intermediate product in Circle fits inside coord_t
+    template <typename coord_t>
+    inline constexpr coord_t max_circle_radius {static_cast<coord_t>(coord_t{1} << ((std::numeric_limits<coord_t>::digits - 3)/2))};
+
+    // Largest absolute control point coordinate for which the forward differences in QuadBezier and CubicBezier stay well under a pixel of error
+    template <typename coord_t>
+    inline constexpr coord_t max_bezier_coordinate {static_cast<coord_t>(coord_t{1} << std::min(std::numeric_limits<coord_t>::digits - 4, std::numeric_limits<double>::digits - 13))};
+
+    template <typename coord_t>
+    std::vector<std::array<coord_t, 2>> Line(const std::array<std::array<coord_t, 2>, 2>& line_points);
+
+    template <typename coord_t>
+    std::vector<std::array<coord_t, 2>> Circle(coord_t radius,
+                                               const std::array<coord_t, 2>& center);
+
+    template <typename coord_t>
+    std::vector<std::array<coord_t, 2>> QuadBezier(const std::array<std::array<coord_t, 2>, 3>& control_points);
+
+    template <typename coord_t>
+    std::vector<std::array<coord_t, 2>> CubicBezier(const std::array<std::array<coord_t, 2>, 4>& control_points);
 }
 
 #endif
@@ -13,30 +13,62 @@
 
 # include <array>
 # include <vector>
+# include <new>
+# include <stdexcept>
 # include <ranges>
+# include <limits>
+# include <cstdint>
+# include <cstring>
+# include <iterator>
+# include <algorithm>
+# include <cmath>
 
 # include "../orig_algo_impl/Rasterization.hpp"
 
 
-static PyObject* Line(PyObject* self, PyObject* args)
+template <typename coord_t>
+static bool Line_Fits(const std::array<std::array<long long, 2>, 2>& line_points)
 {
-    int x_1;
-    int y_1;
-    int x_2;
-    int y_2;
+    constexpr long long limit {Rasterization::max_line_coordinate<coord_t>};
+
+    return std::ranges::all_of(line_points | std::views::join,
+                               [](long long coordinate){ return -limit <= coordinate && coordinate <= limit; });
+}
 
-    if(!PyArg_ParseTuple(args, "iiii", &x_1, &y_1, &x_2, &y_2)) { return NULL; }
 
-    std::vector<std::array<int, 2>> points {Rasterization::Line({{{x_1, y_1}, {x_2, y_2}}})};
+template <typename coord_t>
+static bool Circle_Fits(long long radius, const std::array<long long, 2>& center)
+{
+    constexpr long long max_radius {Rasterization::max_circle_radius<coord_t>};
+    constexpr long long max_coordinate {std::numeric_limits<coord_t>::max()};
+
+    return 0 <= radius && radius <= max_radius &&
+           std::ranges::all_of(center,
+                               [radius](long long coordinate){ return radius - max_coordinate <= coordinate && coordinate <= max_coordinate - radius; });
+}
+
+
+template <typename coord_t, std::size_t degree>
+static bool Bezier_Fits(const std::array<std::array<long long, 2>, degree + 1>& control_points)
+{
+    constexpr long long limit {Rasterization::max_bezier_coordinate<coord_t>};
+
+    return std::ranges::all_of(control_points | std::views::join,
+                               [](long long coordinate){ return -limit <= coordinate && coordinate <= limit; });
+}
 
+
+template <typename coord_t>
+static PyObject* Points_To_List(const std::vector<std::array<coord_t, 2>>& points)
+{
     PyObject* tmp_py_tuple;
     PyObject* py_list {PyList_New(static_cast<Py_ssize_t>(points.size()))};
 
     for(std::size_t n {0}; n < points.size(); n++) {
         const auto& [x, y] = points[n];
         tmp_py_tuple = PyTuple_New(2);
-        PyTuple_SetItem(tmp_py_tuple, 0, PyLong_FromLong(x));
-        PyTuple_SetItem(tmp_py_tuple, 1, PyLong_FromLong(y));
+        PyTuple_SetItem(tmp_py_tuple, 0, PyLong_FromLongLong(x));
+        PyTuple_SetItem(tmp_py_tuple, 1, PyLong_FromLongLong(y));
         PyList_SetItem(py_list, static_cast<Py_ssize_t>(n), tmp_py_tuple);
     }
 
@@ -44,28 +76,362 @@ static PyObject* Line(PyObject* self, PyObject* args)
 }
 
 
+template <typename coord_t>
+static void Append_Points(const std::vector<std::array<coord_t, 2>>& points,
+                          std::vector<std::array<long long, 2>>& batch_points)
+{
+    std::ranges::transform(points,
+                           std::back_inserter(batch_points),
+                           [](const std::array<coord_t, 2>& point){ return std::array<long long, 2> {point[0], point[1]}; });
+}
+
+
+template <typename coord_t>
+static std::vector<std::array<coord_t, 2>> Line(const std::array<std::array<long long, 2>, 2>& line_points)
+{
+    const auto& [p_1, p_2] = line_points;
+    const auto& [x_1, y_1] = p_1;
+    const auto& [x_2, y_2] = p_2;
+
+    return Rasterization::Line<coord_t>({{{static_cast<coord_t>(x_1), static_cast<coord_t>(y_1)},
+                                          {static_cast<coord_t>(x_2), static_cast<coord_t>(y_2)}}});
+}
+
+
+template <typename coord_t>
+static std::vector<std::array<coord_t, 2>> Circle(long long radius, const std::array<long long, 2>& center)
+{
+    const auto& [x_c, y_c] = center;
+
+    return Rasterization::Circle<coord_t>(static_cast<coord_t>(radius),
+                                          {static_cast<coord_t>(x_c), static_cast<coord_t>(y_c)});
+}
+
+
+template <typename coord_t, std::size_t degree>
+static std::vector<std::array<coord_t, 2>> Bezier(const std::array<std::array<long long, 2>, degree + 1>& control_points)
+{
+    std::array<std::array<coord_t, 2>, degree + 1> narrowed_control_points;
+    std::ranges::transform(control_points,
+                           narrowed_control_points.begin(),
+                           [](const std::array<long long, 2>& point){ return std::array<coord_t, 2> {static_cast<coord_t>(point[0]), static_cast<coord_t>(point[1])}; });
+
+    if constexpr (degree == 2) {
+        return Rasterization::QuadBezier<coord_t>(narrowed_control_points);
+    } else {
+        return Rasterization::CubicBezier<coord_t>(narrowed_control_points);
+    }
+}
+
+
+static bool Line_Arguments_Fit(const std::array<long long, 4>& arguments)
+{
+    return Line_Fits<std::int64_t>({{{arguments[0], arguments[1]}, {arguments[2], arguments[3]}}});
+}
+
+
+static std::size_t Line_Size(const std::array<long long, 4>& arguments)
+{
+    return static_cast<std::size_t>(std::max(std::abs(arguments[2] - arguments[0]), std::abs(arguments[3] - arguments[1]))) + 1;
+}
+
+
+static void Append_Line(const std::array<long long, 4>& arguments,
+                        std::vector<std::array<long long, 2>>& batch_points)
+{
+    std::array<std::array<long long, 2>, 2> line_points {{{arguments[0], arguments[1]}, {arguments[2], arguments[3]}}};
+
+    if(Line_Fits<std::int32_t>(line_points)) {
+        Append_Points(Line<std::int32_t>(line_points), batch_points);
+    } else {
+        Append_Points(Line<std::int64_t>(line_points), batch_points);
+    }
+}
+
+
+static bool Circle_Arguments_Fit(const std::array<long long, 3>& arguments)
+{
+    return Circle_Fits<std::int64_t>(arguments[0], {arguments[1], arguments[2]});
+}
+
+
+static std::size_t Circle_Size_Bound(const std::array<long long, 3>& arguments)
+{
+    return 8*(static_cast<std::size_t>(static_cast<double>(arguments[0])/std::sqrt(2)) + 1);
+}
+
+
+static void Append_Circle(const std::array<long long, 3>& arguments,
+                          std::vector<std::array<long long, 2>>& batch_points)
+{
+    std::array<long long, 2> center {arguments[1], arguments[2]};
+
+    if(Circle_Fits<std::int32_t>(arguments[0], center)) {
+        Append_Points(Circle<std::int32_t>(arguments[0], center), batch_points);
+    } else {
+        Append_Points(Circle<std::int64_t>(arguments[0], center), batch_points);
+    }
+}
+
+
+template <std::size_t degree>
+static std::array<std::array<long long, 2>, degree + 1> Bezier_Control_Points(const std::array<long long, 2*(degree + 1)>& arguments)
+{
+    std::array<std::array<long long, 2>, degree + 1> control_points;
+    for(std::size_t n {0}; n <= degree; n++) {
+        control_points[n] = {arguments[2*n], arguments[2*n + 1]};
+    }
+
+    return control_points;
+}
+
+
+template <std::size_t degree>
+static bool Bezier_Arguments_Fit(const std::array<long long, 2*(degree + 1)>& arguments)
+{
+    return Bezier_Fits<std::int64_t, degree>(Bezier_Control_Points<degree>(arguments));
+}
+
+
+// The control polygon is only an estimate of the number of pixels, as each one steps to one of its 8 neighbours
+template <std::size_t degree>
+static std::size_t Bezier_Size_Estimate(const std::array<long long, 2*(degree + 1)>& arguments)
+{
+    std::size_t size_estimate {1};
+    for(std::size_t n {0}; n < degree; n++) {
+        size_estimate += static_cast<std::size_t>(std::max(std::abs(arguments[2*n + 2] - arguments[2*n]),
+                                                           std::abs(arguments[2*n + 3] - arguments[2*n + 1])));
+    }
+
+    return size_estimate;
+}
+
+
+template <std::size_t degree>
+static void Append_Bezier(const std::array<long long, 2*(degree + 1)>& arguments,
+                          std::vector<std::array<long long, 2>>& batch_points)
+{
+    std::array<std::array<long long, 2>, degree + 1> control_points {Bezier_Control_Points<degree>(arguments)};
+
+    if(Bezier_Fits<std::int32_t, degree>(control_points)) {
+        Append_Points(Bezier<std::int32_t, degree>(control_points), batch_points);
+    } else {
+        Append_Points(Bezier<std::int64_t, degree>(control_points), batch_points);
+    }
+}
+
+
+// Rasterizes a buffer of 64-bit shape arguments with the GIL released, returning the bytes of the
+// concatenated 64-bit points along with the bytes of the offsets delimiting the points of each shape
+template <std::size_t arity>
+static PyObject* Rasterize_Batch(PyObject* args,
+                                 const char* shape_name,
+                                 bool (*arguments_fit)(const std::array<long long, arity>&),
+                                 std::size_t (*size_estimate)(const std::array<long long, arity>&),
+                                 void (*append_shape)(const std::array<long long, arity>&, std::vector<std::array<long long, 2>>&))
+{
+    Py_buffer buffer;
+
+    if(!PyArg_ParseTuple(args, "y*", &buffer)) { return NULL; }
+
+    std::size_t buffer_size {static_cast<std::size_t>(buffer.len)};
+
+    if(buffer_size % sizeof(std::array<long long, arity>) != 0) {
+        PyBuffer_Release(&buffer);
+        PyErr_Format(PyExc_ValueError, "%s arguments must be %zu 64-bit integers per shape", shape_name, arity);
+        return NULL;
+    }
+
+    std::vector<std::array<long long, arity>> shapes (buffer_size/sizeof(std::array<long long, arity>));
+    std::memcpy(shapes.data(), buffer.buf, buffer_size);
+    PyBuffer_Release(&buffer);
+
+    for(std::size_t n {0}; n < shapes.size(); n++) {
+        if(!arguments_fit(shapes[n])) {
+            PyErr_Format(PyExc_OverflowError, "%s %zu lies outside of the supported coordinate range", shape_name, n);
+            return NULL;
+        }
+    }
+
+    std::vector<std::array<long long, 2>> points;
+    std::vector<long long> offsets (shapes.size() + 1);
+    bool out_of_memory {false};
+
+    // The estimate is only a hint, saturated at max_size() rather than wrapping around
+    std::size_t points_estimate {0};
+    for(const std::array<long long, arity>& shape_arguments : shapes) {
+        points_estimate = std::min(points_estimate + std::min(size_estimate(shape_arguments), points.max_size()), points.max_size());
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    try {
+        try {
+            points.reserve(points_estimate);
+        } catch(const std::bad_alloc&) {
+            // Shapes that really are this large run out of memory below, and the others only lose the head start
+        }
+
+        for(std::size_t n {0}; n < shapes.size(); n++) {
+            append_shape(shapes[n], points);
+            offsets[n + 1] = static_cast<long long>(points.size());
+        }
+    } catch(const std::bad_alloc&) {
+        out_of_memory = true;
+    } catch(const std::length_error&) {
+        out_of_memory = true;
+    }
+    Py_END_ALLOW_THREADS
+
+    if(out_of_memory) { return PyErr_NoMemory(); }
+
+    return Py_BuildValue("(NN)",
+                         PyBytes_FromStringAndSize(reinterpret_cast<const char*>(points.data()),
+                                                   static_cast<Py_ssize_t>(points.size()*sizeof(points[0]))),
+                         PyBytes_FromStringAndSize(reinterpret_cast<const char*>(offsets.data()),
+                                                   static_cast<Py_ssize_t>(offsets.size()*sizeof(offsets[0]))));
+}
+
+
+static PyObject* Line(PyObject* self, PyObject* args)
+{
+    long long x_1;
+    long long y_1;
+    long long x_2;
+    long long y_2;
+
+    if(!PyArg_ParseTuple(args, "LLLL", &x_1, &y_1, &x_2, &y_2)) { return NULL; }
+
+    std::array<std::array<long long, 2>, 2> line_points {{{x_1, y_1}, {x_2, y_2}}};
+
+    try {
+        if(Line_Fits<std::int32_t>(line_points)) {
+            return Points_To_List(Line<std::int32_t>(line_points));
+        } else if(Line_Fits<std::int64_t>(line_points)) {
+            return Points_To_List(Line<std::int64_t>(line_points));
+        } else {
+            PyErr_Format(PyExc_OverflowError,
+                         "Line coordinates must lie within [-%lld, %lld]",
+                         static_cast<long long>(Rasterization::max_line_coordinate<std::int64_t>),
+                         static_cast<long long>(Rasterization::max_line_coordinate<std::int64_t>));
+            return NULL;
+        }
+    } catch(const std::bad_alloc&) {
+        return PyErr_NoMemory();
+    } catch(const std::length_error&) {
+        // Raised for paths with more points than a std::vector can ever hold
+        return PyErr_NoMemory();
+    }
+}
+
+
 static PyObject* Circle(PyObject* self, PyObject* args)
 {
-    int radius;
-    int x_c;
-    int y_c;
+    long long radius;
+    long long x_c;
+    long long y_c;
 
-    if(!PyArg_ParseTuple(args, "iii", &radius, &x_c, &y_c)) { return NULL; }
+    if(!PyArg_ParseTuple(args, "LLL", &radius, &x_c, &y_c)) { return NULL; }
 
-    std::vector<std::array<int, 2>> points {Rasterization::Circle(radius, {x_c, y_c})};
+    std::array<long long, 2> center {x_c, y_c};
 
-    PyObject* tmp_py_tuple;
-    PyObject* py_list {PyList_New(static_cast<Py_ssize_t>(points.size()))};
+    try {
+        if(Circle_Fits<std::int32_t>(radius, center)) {
+            return Points_To_List(Circle<std::int32_t>(radius, center));
+        } else if(Circle_Fits<std::int64_t>(radius, center)) {
+            return Points_To_List(Circle<std::int64_t>(radius, center));
+        } else if(radius < 0) {
+            PyErr_Format(PyExc_ValueError, "Circle radius must not be negative, got %lld", radius);
+            return NULL;
+        } else if(radius > Rasterization::max_circle_radius<std::int64_t>) {
+            PyErr_Format(PyExc_OverflowError,
+                         "Circle radius must lie within [0, %lld]",
+                         static_cast<long long>(Rasterization::max_circle_radius<std::int64_t>));
+            return NULL;
+        } else {
+            PyErr_Format(PyExc_OverflowError,
+                         "Circle center must lie within [%lld, %lld] for a radius of %lld",
+                         radius - std::numeric_limits<std::int64_t>::max(),
+                         std::numeric_limits<std::int64_t>::max() - radius,
+                         radius);
+            return NULL;
+        }
+    } catch(const std::bad_alloc&) {
+        return PyErr_NoMemory();
+    } catch(const std::length_error&) {
+        return PyErr_NoMemory();
+    }
+}
 
-    for(std::size_t n {0}; n < points.size(); n++) {
-        const auto& [x, y] = points[n];
-        tmp_py_tuple = PyTuple_New(2);
-        PyTuple_SetItem(tmp_py_tuple, 0, PyLong_FromLong(x));
-        PyTuple_SetItem(tmp_py_tuple, 1, PyLong_FromLong(y));
-        PyList_SetItem(py_list, static_cast<Py_ssize_t>(n), tmp_py_tuple);
+
+template <std::size_t degree>
+static PyObject* Bezier(PyObject* args)
+{
+    std::array<long long, 2*(degree + 1)> arguments;
+    bool parsed;
+
+    if constexpr (degree == 2) {
+        parsed = PyArg_ParseTuple(args, "LLLLLL", &arguments[0], &arguments[1], &arguments[2], &arguments[3], &arguments[4], &arguments[5]);
+    } else {
+        parsed = PyArg_ParseTuple(args, "LLLLLLLL", &arguments[0], &arguments[1], &arguments[2], &arguments[3], &arguments[4], &arguments[5], &arguments[6], &arguments[7]);
     }
 
-    return py_list;
+    if(!parsed) { return NULL; }
+
+    std::array<std::array<long long, 2>, degree + 1> control_points {Bezier_Control_Points<degree>(arguments)};
+
+    try {
+        if(Bezier_Fits<std::int32_t, degree>(control_points)) {
+            return Points_To_List(Bezier<std::int32_t, degree>(control_points));
+        } else if(Bezier_Fits<std::int64_t, degree>(control_points)) {
+            return Points_To_List(Bezier<std::int64_t, degree>(control_points));
+        } else {
+            PyErr_Format(PyExc_OverflowError,
+                         "Bezier control points must lie within [-%lld, %lld]",
+                         static_cast<long long>(Rasterization::max_bezier_coordinate<std::int64_t>),
+                         static_cast<long long>(Rasterization::max_bezier_coordinate<std::int64_t>));
+            return NULL;
+        }
+    } catch(const std::bad_alloc&) {
+        return PyErr_NoMemory();
+    } catch(const std::length_error&) {
+        return PyErr_NoMemory();
+    }
+}
+
+
+static PyObject* QuadBezier(PyObject* self, PyObject* args)
+{
+    return Bezier<2>(args);
+}
+
+
+static PyObject* CubicBezier(PyObject* self, PyObject* args)
+{
+    return Bezier<3>(args);
+}
+
+
+static PyObject* Lines(PyObject* self, PyObject* args)
+{
+    return Rasterize_Batch(args, "Line", Line_Arguments_Fit, Line_Size, Append_Line);
+}
+
+
+static PyObject* Circles(PyObject* self, PyObject* args)
+{
+    return Rasterize_Batch(args, "Circle", Circle_Arguments_Fit, Circle_Size_Bound, Append_Circle);
+}
+
+
+static PyObject* QuadBeziers(PyObject* self, PyObject* args)
+{
+    return Rasterize_Batch(args, "QuadBezier", Bezier_Arguments_Fit<2>, Bezier_Size_Estimate<2>, Append_Bezier<2>);
+}
+
+
+static PyObject* CubicBeziers(PyObject* self, PyObject* args)
+{
+    return Rasterize_Batch(args, "CubicBezier", Bezier_Arguments_Fit<3>, Bezier_Size_Estimate<3>, Append_Bezier<3>);
 }
 
 
@@ -78,6 +444,30 @@ static PyMethodDef rasterizationMethods[] = {
      Circle,
      METH_VARARGS,
      NULL},
+    {"Lines",
+     Lines,
+     METH_VARARGS,
+     NULL},
+    {"Circles",
+     Circles,
+     METH_VARARGS,
+     NULL},
+    {"QuadBezier",
+     QuadBezier,
+     METH_VARARGS,
+     NULL},
+    {"CubicBezier",
+     CubicBezier,
+     METH_VARARGS,
+     NULL},
+    {"QuadBeziers",
+     QuadBeziers,
+     METH_VARARGS,
+     NULL},
+    {"CubicBeziers",
+     CubicBeziers,
+     METH_VARARGS,
+     NULL},
     {NULL, NULL, 0, NULL}};
 
 